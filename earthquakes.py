@@ -2,10 +2,38 @@
 # over the Internet.
 # However, we will use a more powerful and simpler library called requests.
 # This is external library that you may need to install first.
+import functools
 import json
+import os
 import requests
 
-def get_data():
+# orjson parses JSON noticeably faster than the standard library, but it is
+# optional: if it isn't installed we fall back to the built-in json module.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+DATA_FILE = 'text.json'
+
+
+def load_local_data(path=DATA_FILE):
+    """Load a previously downloaded response from disk."""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def get_data(use_cache=True, save=True):
+    # The query covers a fixed window in the past, so the answer never
+    # changes. If we have already saved it, there is no need to ask again.
+    # If the saved copy can't be parsed, fall through and download it again.
+    if use_cache and os.path.exists(DATA_FILE):
+        try:
+            return load_local_data()
+        except ValueError:
+            pass
+
     # With requests, we can ask the web service for the data.
     # Can you understand the parameters we are passing here?
     response = requests.get(
@@ -20,24 +48,29 @@ def get_data():
             "endtime": "2018-10-11",
             "orderby": "time-asc"}
     )
+    # Stop here if the service reported an error (e.g. it is unavailable),
+    # rather than trying to interpret an error page as data.
+    response.raise_for_status()
 
     # The response we get back is an object with several fields.
-    # The actual contents we care about are in its text field:
-    text = response.text
-    # To understand the structure of this text, you may want to save it
-    # to a file and open it in VS Code or a browser.
+    # The actual contents we care about are in its body, which we can
+    # interpret directly as JSON without going through a file.
+    content = response.content
+    data = _loads(content)
+    # We also save a copy, so later runs can reuse it and so that you can
+    # open it in VS Code or a browser to understand its structure.
     # See the README file for more information.
-    with open('text.json', 'w') as f:
-        f.write(text)
-    
-    with open('text.json', 'r') as f:
-        data = json.load(f)
-
-        
-    # We need to interpret the text to get values that we can work with.
-    # What format is the text in? How can we load the values?
+    # We only save after parsing has succeeded, and write to a temporary
+    # file first, so a bad or half-written response is never kept around.
+    if save:
+        temp_file = DATA_FILE + '.tmp'
+        with open(temp_file, 'wb') as f:
+            f.write(content)
+        os.replace(temp_file, DATA_FILE)
+
     return data
 
+
 def count_earthquakes(data):
     """Get the total number of earthquakes in the response."""
     return len(data['features'])
@@ -51,7 +84,8 @@ def get_magnitude(earthquake):
 def get_location(earthquake):
     """Retrieve the latitude and longitude of an earthquake item."""
     # There are three coordinates, but we don't care about the third (altitude)
-    return earthquake['geometry']['coordinates'][0], earthquake['geometry']['coordinates'][1]
+    coordinates = earthquake['geometry']['coordinates']
+    return coordinates[0], coordinates[1]
 
 
 def get_maximum(data):
@@ -61,8 +95,16 @@ def get_maximum(data):
     return get_magnitude(strongest), get_location(strongest)
 
 
-# With all the above functions defined, we can now call them and get the result
-data = get_data()
-print(f"Loaded {count_earthquakes(data)}")
-max_magnitude, max_location = get_maximum(data)
-print(f"The strongest earthquake was at {max_location} with magnitude {max_magnitude}")
\ No newline at end of file
+@functools.cache
+def get_cached_data():
+    """Get the earthquake data, loading it only the first time it's needed."""
+    return get_data()
+
+
+# With all the above functions defined, we can now call them and get the result.
+# This only runs when the file is executed as a script, not when it's imported.
+if __name__ == "__main__":
+    data = get_cached_data()
+    print(f"Loaded {count_earthquakes(data)}")
+    max_magnitude, max_location = get_maximum(data)
+    print(f"The strongest earthquake was at {max_location} with magnitude {max_magnitude}")